@@ -9,35 +9,59 @@ Provides API endpoints for:
 - Educational content about DNA structure
 
 Dependencies:
-pip install fastapi uvicorn websockets opencv-python numpy mediapipe
+pip install fastapi uvicorn websockets opencv-python numpy numba orjson msgpack mediapipe
 """
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 import json
+import orjson
+import msgpack
 import numpy as np
+from numba import njit
 import cv2
 import base64
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Union
 from pydantic import BaseModel
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
 import random
+import re
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Message timestamp, refreshed every 100 ms by a background task so hot paths
+# don't format the current time per message
+_now_iso = datetime.now().isoformat()
+
+async def _tick():
+    """Keep the cached message timestamp current"""
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(0.1)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tick_task = asyncio.create_task(_tick())
+    yield
+    tick_task.cancel()
+
 # FastAPI app initialization
 app = FastAPI(
     title="DNA Explorer API",
     description="Backend for Gesture-Controlled 3D DNA Model Explorer",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware for cross-origin requests
@@ -50,19 +74,18 @@ app.add_middleware(
 )
 
 # Data Models
-class DNABase(BaseModel):
-    """DNA base with position and properties"""
-    base_type: str  # A, T, G, C
-    position: List[float]  # [x, y, z]
-    strand: int  # 1 or 2
-    index: int
-    pair_index: Optional[int] = None
+class DNABases(BaseModel):
+    """DNA bases as parallel arrays, strand 1 and strand 2 interleaved per pair"""
+    base_types: str  # A, T, G, C; one character per base
+    positions: List[List[float]]  # [x, y, z] per base
+    strands: List[int]  # 1 or 2
+    pair_indices: List[int]
 
 class DNASequence(BaseModel):
     """Complete DNA sequence with metadata"""
     sequence: str
     length: int
-    bases: List[DNABase]
+    bases: DNABases
     gc_content: float
     melting_temperature: float
     complementary_sequence: str
@@ -85,11 +108,82 @@ class VisualizationConfig(BaseModel):
     base_pair_distance: float = 0.34
     rotation_speed: float = 0.005
 
+class ConfigUpdateMessage(BaseModel):
+    """WebSocket message announcing the current visualization configuration"""
+    type: str = "config_update"
+    config: VisualizationConfig
+    timestamp: str
+
+class DNADataMessage(BaseModel):
+    """WebSocket message carrying the current DNA sequence"""
+    type: str = "dna_data"
+    data: DNASequence
+    timestamp: str
+
 # Global state
-active_connections: List[WebSocket] = []
+active_connections: Set[WebSocket] = set()
 current_config = VisualizationConfig()
 dna_data = None
 
+# Payloads sent to every new WebSocket client, encoded lazily per wire format
+# and invalidated whenever the config or DNA data changes
+_config_message = ConfigUpdateMessage(config=current_config, timestamp=_now_iso)
+_config_payload_bytes: Dict[bool, bytes] = {}
+_dna_message: Optional[DNADataMessage] = None
+_dna_payload_bytes: Dict[bool, bytes] = {}
+
+# Lookup tables for sequence manipulation
+_COMPLEMENT_TABLE = str.maketrans('ATGCatgc', 'TACGTACG')
+_NON_BASE_PATTERN = re.compile(r'[^ATGC]')
+
+# Maps every byte value to a base; 256 is a multiple of 4 so bases stay uniform
+_RANDOM_BASE_TABLE = bytes(b'ATGC'[i % 4] for i in range(256))
+
+def _dumps(payload) -> bytes:
+    """Serialize a WebSocket payload to JSON bytes"""
+    return orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+class _OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson, for routes returning plain dicts"""
+    def render(self, content) -> bytes:
+        return _dumps(content)
+
+def _encode(payload, use_msgpack: bool) -> bytes:
+    """Serialize a WebSocket payload as MessagePack or JSON bytes"""
+    if isinstance(payload, BaseModel):
+        # pydantic-core writes JSON straight from the model, with no intermediate dict
+        if not use_msgpack:
+            return type(payload).__pydantic_serializer__.to_json(payload)
+        payload = payload.model_dump()
+    if use_msgpack:
+        return msgpack.packb(payload, use_bin_type=True, default=str)
+    return _dumps(payload)
+
+def _encode_cached(payload, use_msgpack: bool, cache: Dict[bool, bytes]) -> bytes:
+    """Serialize a payload, reusing a previous encoding in the same wire format"""
+    if use_msgpack not in cache:
+        cache[use_msgpack] = _encode(payload, use_msgpack)
+    return cache[use_msgpack]
+
+@lru_cache(maxsize=128)
+def _helix_positions(total_pairs: int, helix_radius: float, base_pair_distance: float) -> np.ndarray:
+    """Read-only (2 * total_pairs, 3) helix positions, strand 1 and strand 2 interleaved"""
+    # Calculate helix positions for all base pairs at once
+    i = np.arange(total_pairs, dtype=np.float64)
+    angle = i * (4 * np.pi / total_pairs) if total_pairs else i
+    y = (i - total_pairs / 2) * base_pair_distance
+
+    # Strand 1 position; strand 2 sits on the opposite side
+    # (cos(a + pi) = -cos(a), sin(a + pi) = -sin(a))
+    x1 = helix_radius * np.cos(angle)
+    z1 = helix_radius * np.sin(angle)
+
+    positions = np.empty((2 * total_pairs, 3), dtype=np.float64)
+    positions[0::2] = np.stack([x1, y, z1], axis=1)
+    positions[1::2] = np.stack([-x1, y, -z1], axis=1)
+    positions.setflags(write=False)
+    return positions
+
 # DNA utility functions
 class DNAUtilities:
     """Utility functions for DNA sequence manipulation and analysis"""
@@ -97,69 +191,95 @@ class DNAUtilities:
     @staticmethod
     def generate_random_sequence(length: int = 20) -> str:
         """Generate a random DNA sequence"""
-        bases = ['A', 'T', 'G', 'C']
-        return ''.join(random.choices(bases, k=length))
+        return random.randbytes(length).translate(_RANDOM_BASE_TABLE).decode('ascii')
     
     @staticmethod
     def get_complement(sequence: str) -> str:
         """Get complementary DNA sequence"""
-        complement_map = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G'}
-        return ''.join(complement_map.get(base, 'N') for base in sequence.upper())
+        return _NON_BASE_PATTERN.sub('N', sequence.translate(_COMPLEMENT_TABLE))
     
     @staticmethod
     def calculate_gc_content(sequence: str) -> float:
         """Calculate GC content percentage"""
-        gc_count = sequence.upper().count('G') + sequence.upper().count('C')
+        sequence = sequence.upper()
+        gc_count = sequence.count('G') + sequence.count('C')
         return (gc_count / len(sequence)) * 100 if sequence else 0
     
     @staticmethod
     def calculate_melting_temperature(sequence: str) -> float:
         """Estimate melting temperature using Wallace rule (simplified)"""
-        at_count = sequence.upper().count('A') + sequence.upper().count('T')
-        gc_count = sequence.upper().count('G') + sequence.upper().count('C')
+        sequence = sequence.upper()
+        at_count = sequence.count('A') + sequence.count('T')
+        gc_count = sequence.count('G') + sequence.count('C')
         return (at_count * 2) + (gc_count * 4)
     
     @staticmethod
     def generate_3d_coordinates(sequence: str, helix_radius: float = 2.5, 
-                               base_pair_distance: float = 0.34) -> List[DNABase]:
+                               base_pair_distance: float = 0.34) -> DNABases:
         """Generate 3D coordinates for DNA bases"""
-        bases = []
         complement_sequence = DNAUtilities.get_complement(sequence)
         total_pairs = len(sequence)
-        
-        for i, (base1, base2) in enumerate(zip(sequence, complement_sequence)):
-            # Calculate helix positions
-            angle = (i / total_pairs) * np.pi * 4
-            y = (i - total_pairs / 2) * base_pair_distance
-            
-            # Strand 1 position
-            x1 = helix_radius * np.cos(angle)
-            z1 = helix_radius * np.sin(angle)
-            
-            # Strand 2 position (opposite side)
-            x2 = helix_radius * np.cos(angle + np.pi)
-            z2 = helix_radius * np.sin(angle + np.pi)
-            
-            # Create base objects
-            base1_obj = DNABase(
-                base_type=base1,
-                position=[float(x1), float(y), float(z1)],
-                strand=1,
-                index=i,
-                pair_index=i
-            )
-            
-            base2_obj = DNABase(
-                base_type=base2,
-                position=[float(x2), float(y), float(z2)],
-                strand=2,
-                index=i,
-                pair_index=i
-            )
-            
-            bases.extend([base1_obj, base2_obj])
-        
-        return bases
+
+        # Geometry depends only on the length and helix shape, not on the bases
+        positions = _helix_positions(total_pairs, helix_radius, base_pair_distance)
+
+        # Interleave strand 1 and strand 2 bases
+        base_types = [''] * (2 * total_pairs)
+        base_types[0::2] = sequence
+        base_types[1::2] = complement_sequence
+
+        return DNABases(
+            base_types=''.join(base_types),
+            positions=positions.tolist(),
+            strands=[1, 2] * total_pairs,
+            pair_indices=np.repeat(np.arange(total_pairs), 2).tolist()
+        )
+
+# Gesture codes returned by the compiled detection kernel
+_GESTURE_TYPES = ("unknown", "pinch", "point", "open_hand", "fist")
+
+@njit(cache=True)
+def _detect_kernel(points):
+    """Classify a (21, 3) landmark array into (gesture code, confidence, pinch distance)"""
+    # Check finger extensions (landmark pairs: tip/pip)
+    is_thumb_up = points[4, 0] > points[3, 0]  # Simplified thumb check
+    is_index_up = points[8, 1] < points[6, 1]
+    num_extended = 0
+    if is_thumb_up:
+        num_extended += 1
+    if is_index_up:
+        num_extended += 1
+    if points[12, 1] < points[10, 1]:
+        num_extended += 1
+    if points[16, 1] < points[14, 1]:
+        num_extended += 1
+    if points[20, 1] < points[18, 1]:
+        num_extended += 1
+    
+    # Calculate pinch distance between thumb tip and index tip
+    dist_sq = 0.0
+    for axis in range(points.shape[1]):
+        delta = points[4, axis] - points[8, axis]
+        dist_sq += delta * delta
+    pinch_distance = np.sqrt(dist_sq)
+    
+    # Gesture classification
+    if pinch_distance < 0.05:
+        return 1, 0.9, pinch_distance
+    elif num_extended == 1 and is_index_up:
+        return 2, 0.8, pinch_distance
+    elif num_extended == 5:
+        return 3, 0.8, pinch_distance
+    elif num_extended == 0:
+        return 4, 0.8, pinch_distance
+    return 0, 0.3, pinch_distance
+
+# Compile the kernel at import so the first gesture frame doesn't pay the JIT cost
+_detect_kernel(np.zeros((21, 3), dtype=np.float64))
+
+# Precompute helix positions for every length served by /api/dna/random
+for _length in range(1, 101):
+    _helix_positions(_length, 2.5, 0.34)
 
 class GestureProcessor:
     """Process and analyze hand gestures from MediaPipe"""
@@ -170,45 +290,19 @@ class GestureProcessor:
         if len(landmarks) != 21:
             return {"type": "unknown", "confidence": 0.0}
         
-        # Convert to numpy array for easier processing
-        points = np.array(landmarks)
-        
-        # Get key landmark indices
-        thumb_tip = points[4]
-        thumb_pip = points[3]
-        index_tip = points[8]
-        index_pip = points[6]
-        middle_tip = points[12]
-        middle_pip = points[10]
-        ring_tip = points[16]
-        ring_pip = points[14]
-        pinky_tip = points[20]
-        pinky_pip = points[18]
-        
-        # Check finger extensions
-        is_thumb_up = thumb_tip[0] > thumb_pip[0]  # Simplified thumb check
-        is_index_up = index_tip[1] < index_pip[1]
-        is_middle_up = middle_tip[1] < middle_pip[1]
-        is_ring_up = ring_tip[1] < ring_pip[1]
-        is_pinky_up = pinky_tip[1] < pinky_pip[1]
-        
-        extended_fingers = [is_thumb_up, is_index_up, is_middle_up, is_ring_up, is_pinky_up]
-        num_extended = sum(extended_fingers)
+        # Convert to numpy array once and run the compiled kernel
+        points = np.asarray(landmarks, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] < 2:
+            return {"type": "unknown", "confidence": 0.0}
         
-        # Calculate pinch distance
-        pinch_distance = np.linalg.norm(thumb_tip - index_tip)
+        code, confidence, pinch_distance = _detect_kernel(points)
+        gesture_type = _GESTURE_TYPES[code]
         
-        # Gesture classification
-        if pinch_distance < 0.05:
-            return {"type": "pinch", "confidence": 0.9, "distance": float(pinch_distance)}
-        elif num_extended == 1 and is_index_up:
-            return {"type": "point", "confidence": 0.8, "position": index_tip.tolist()}
-        elif num_extended == 5:
-            return {"type": "open_hand", "confidence": 0.8}
-        elif num_extended == 0:
-            return {"type": "fist", "confidence": 0.8}
-        else:
-            return {"type": "unknown", "confidence": 0.3}
+        if gesture_type == "pinch":
+            return {"type": gesture_type, "confidence": confidence, "distance": float(pinch_distance)}
+        elif gesture_type == "point":
+            return {"type": gesture_type, "confidence": confidence, "position": points[8].tolist()}
+        return {"type": gesture_type, "confidence": confidence}
     
     @staticmethod
     def calculate_rotation_from_point(position: List[float]) -> Dict[str, float]:
@@ -230,7 +324,7 @@ async def root():
     """Serve the main HTML file"""
     return FileResponse("index.html")
 
-@app.get("/api/health")
+@app.get("/api/health", response_class=_OrjsonResponse)
 async def health_check():
     """Health check endpoint"""
     return {
@@ -260,12 +354,14 @@ async def generate_random_dna(length: int = 20) -> DNASequence:
         complementary_sequence=complement
     )
     
-    global dna_data
+    global dna_data, _dna_message, _dna_payload_bytes
     dna_data = dna_sequence
+    _dna_message = DNADataMessage(data=dna_sequence, timestamp=_now_iso)
+    _dna_payload_bytes = {}
     
     return dna_sequence
 
-@app.post("/api/dna/validate")
+@app.post("/api/dna/validate", response_class=_OrjsonResponse)
 async def validate_dna_sequence(sequence: str) -> Dict:
     """Validate a DNA sequence"""
     valid_bases = set('ATGC')
@@ -285,82 +381,83 @@ async def validate_dna_sequence(sequence: str) -> Dict:
     return {
         "valid": True,
         "length": len(sequence),
-        "gc_content": DNAUtilities.calculate_gc_content(sequence),
+        "gc_content": ((sequence.count('G') + sequence.count('C')) / len(sequence)) * 100,
         "complement": DNAUtilities.get_complement(sequence)
     }
 
+# DNA base reference data, serialized once at import
+BASE_INFO = {
+    'A': {
+        "name": "Adenine",
+        "type": "Purine",
+        "formula": "C₅H₅N₅",
+        "pairs_with": "Thymine",
+        "bonds": 2,
+        "color": "#ff6b6b",
+        "description": "A purine base that pairs with thymine through two hydrogen bonds."
+    },
+    'T': {
+        "name": "Thymine",
+        "type": "Pyrimidine", 
+        "formula": "C₅H₆N₂O₂",
+        "pairs_with": "Adenine",
+        "bonds": 2,
+        "color": "#ffd93d",
+        "description": "A pyrimidine base that pairs with adenine through two hydrogen bonds."
+    },
+    'G': {
+        "name": "Guanine",
+        "type": "Purine",
+        "formula": "C₅H₅N₅O", 
+        "pairs_with": "Cytosine",
+        "bonds": 3,
+        "color": "#6bcf7f",
+        "description": "A purine base that pairs with cytosine through three hydrogen bonds."
+    },
+    'C': {
+        "name": "Cytosine",
+        "type": "Pyrimidine",
+        "formula": "C₄H₅N₃O",
+        "pairs_with": "Guanine", 
+        "bonds": 3,
+        "color": "#4dabf7",
+        "description": "A pyrimidine base that pairs with guanine through three hydrogen bonds."
+    }
+}
+
+_BASE_INFO_JSON = {base: orjson.dumps(info) for base, info in BASE_INFO.items()}
+
 @app.get("/api/dna/info/{base}")
-async def get_base_info(base: str) -> Dict:
+async def get_base_info(base: str) -> Response:
     """Get detailed information about a DNA base"""
     base = base.upper()
     
-    base_info = {
-        'A': {
-            "name": "Adenine",
-            "type": "Purine",
-            "formula": "C₅H₅N₅",
-            "pairs_with": "Thymine",
-            "bonds": 2,
-            "color": "#ff6b6b",
-            "description": "A purine base that pairs with thymine through two hydrogen bonds."
-        },
-        'T': {
-            "name": "Thymine",
-            "type": "Pyrimidine", 
-            "formula": "C₅H₆N₂O₂",
-            "pairs_with": "Adenine",
-            "bonds": 2,
-            "color": "#ffd93d",
-            "description": "A pyrimidine base that pairs with adenine through two hydrogen bonds."
-        },
-        'G': {
-            "name": "Guanine",
-            "type": "Purine",
-            "formula": "C₅H₅N₅O", 
-            "pairs_with": "Cytosine",
-            "bonds": 3,
-            "color": "#6bcf7f",
-            "description": "A purine base that pairs with cytosine through three hydrogen bonds."
-        },
-        'C': {
-            "name": "Cytosine",
-            "type": "Pyrimidine",
-            "formula": "C₄H₅N₃O",
-            "pairs_with": "Guanine", 
-            "bonds": 3,
-            "color": "#4dabf7",
-            "description": "A pyrimidine base that pairs with guanine through three hydrogen bonds."
-        }
-    }
-    
-    if base not in base_info:
+    if base not in _BASE_INFO_JSON:
         raise HTTPException(status_code=404, detail=f"Base '{base}' not found")
     
-    return base_info[base]
+    return Response(content=_BASE_INFO_JSON[base], media_type="application/json")
 
 @app.get("/api/config")
 async def get_config() -> VisualizationConfig:
     """Get current visualization configuration"""
     return current_config
 
-@app.post("/api/config")
+@app.post("/api/config", response_class=_OrjsonResponse)
 async def update_config(config: VisualizationConfig) -> Dict:
     """Update visualization configuration"""
-    global current_config
+    global current_config, _config_message, _config_payload_bytes
     current_config = config
     
     # Broadcast config update to all connected clients
-    message = {
-        "type": "config_update",
-        "config": config.dict(),
-        "timestamp": datetime.now().isoformat()
-    }
+    message = ConfigUpdateMessage(config=config, timestamp=_now_iso)
     
-    await broadcast_to_clients(json.dumps(message))
+    _config_message = message
+    _config_payload_bytes = {}
+    await broadcast_to_clients(message, _config_payload_bytes)
     
     return {"status": "success", "message": "Configuration updated"}
 
-@app.post("/api/gesture/process")
+@app.post("/api/gesture/process", response_class=_OrjsonResponse)
 async def process_gesture(gesture_data: GestureData) -> Dict:
     """Process hand gesture data"""
     try:
@@ -384,14 +481,14 @@ async def process_gesture(gesture_data: GestureData) -> Dict:
         result = {
             "gesture": gesture_info,
             "transformations": transformations,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso
         }
         
         # Broadcast to connected clients
-        await broadcast_to_clients(json.dumps({
+        await broadcast_to_clients({
             "type": "gesture_update",
             "data": result
-        }))
+        })
         
         return result
         
@@ -400,119 +497,138 @@ async def process_gesture(gesture_data: GestureData) -> Dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 # WebSocket connection manager
-async def broadcast_to_clients(message: str):
+async def broadcast_to_clients(message: Union[Dict, BaseModel], encoded: Optional[Dict[bool, bytes]] = None):
     """Broadcast message to all connected WebSocket clients"""
     if active_connections:
-        disconnected = []
-        for connection in active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.append(connection)
+        # Encode once per wire format rather than once per client
+        if encoded is None:
+            encoded = {}
+        connections = list(active_connections)
+        
+        # Send to all clients concurrently so one slow client doesn't stall the rest
+        results = await asyncio.gather(
+            *(connection.send_bytes(_encode_cached(message, connection.state.use_msgpack, encoded))
+              for connection in connections),
+            return_exceptions=True
+        )
         
         # Remove disconnected clients
-        for connection in disconnected:
-            active_connections.remove(connection)
+        disconnected = {
+            connection for connection, result in zip(connections, results)
+            if isinstance(result, Exception)
+        }
+        active_connections.difference_update(disconnected)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time communication"""
-    await websocket.accept()
-    active_connections.append(websocket)
+    # Clients opt into MessagePack frames via subprotocol or ?format=msgpack
+    msgpack_subprotocol = "msgpack" in websocket.scope.get("subprotocols", [])
+    use_msgpack = msgpack_subprotocol or websocket.query_params.get("format") == "msgpack"
+    websocket.state.use_msgpack = use_msgpack
+    
+    await websocket.accept(subprotocol="msgpack" if msgpack_subprotocol else None)
+    active_connections.add(websocket)
     
     try:
         # Send initial configuration
-        await websocket.send_text(json.dumps({
-            "type": "config_update",
-            "config": current_config.dict(),
-            "timestamp": datetime.now().isoformat()
-        }))
+        await websocket.send_bytes(_encode_cached(_config_message, use_msgpack, _config_payload_bytes))
         
         # Send current DNA data if available
-        if dna_data:
-            await websocket.send_text(json.dumps({
-                "type": "dna_data",
-                "data": dna_data.dict(),
-                "timestamp": datetime.now().isoformat()
-            }))
+        if _dna_message:
+            await websocket.send_bytes(_encode_cached(_dna_message, use_msgpack, _dna_payload_bytes))
         
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            data = await websocket.receive()
+            if data["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(data.get("code", 1000))
+            
+            if data.get("bytes") is not None:
+                message = msgpack.unpackb(data["bytes"])
+            else:
+                message = json.loads(data["text"])
             
             # Handle different message types
             if message["type"] == "gesture_data":
                 gesture_data = GestureData(**message["data"])
                 result = await process_gesture(gesture_data)
                 
-                await websocket.send_text(json.dumps({
+                await websocket.send_bytes(_encode({
                     "type": "gesture_result",
                     "data": result
-                }))
+                }, use_msgpack))
             
             elif message["type"] == "config_update":
                 config = VisualizationConfig(**message["data"])
                 await update_config(config)
     
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
+        active_connections.discard(websocket)
         logger.info(f"WebSocket disconnected. Active connections: {len(active_connections)}")
     
     except Exception as e:
         logger.error(f"WebSocket error: {str(e)}")
-        if websocket in active_connections:
-            active_connections.remove(websocket)
+        active_connections.discard(websocket)
+
+# Educational content, serialized once at import
+DNA_FACTS = [
+    {
+        "title": "DNA Structure",
+        "fact": "DNA has a double helix structure, like a twisted ladder, discovered by Watson, Crick, Franklin, and Wilkins.",
+        "category": "structure"
+    },
+    {
+        "title": "Base Pairing",
+        "fact": "Adenine always pairs with Thymine (2 H-bonds), and Guanine always pairs with Cytosine (3 H-bonds).",
+        "category": "bonding"
+    },
+    {
+        "title": "Human DNA",
+        "fact": "Human DNA contains about 3 billion base pairs and would stretch about 2 meters if unwound from a single cell.",
+        "category": "biology"
+    },
+    {
+        "title": "Genetic Code",
+        "fact": "The sequence of DNA bases determines the genetic instructions for all living organisms.",
+        "category": "genetics"
+    }
+]
+
+MOLECULAR_COMPONENTS = {
+    "sugar_phosphate_backbone": {
+        "description": "The structural framework of DNA, alternating sugar (deoxyribose) and phosphate groups",
+        "function": "Provides structural stability and protection for the bases"
+    },
+    "nitrogenous_bases": {
+        "description": "Four types of bases (A, T, G, C) that carry genetic information",
+        "function": "Store genetic information through their sequence"
+    },
+    "hydrogen_bonds": {
+        "description": "Weak bonds between complementary base pairs",
+        "function": "Hold the two DNA strands together while allowing separation during replication"
+    },
+    "major_minor_grooves": {
+        "description": "Spiral grooves in the DNA double helix",
+        "function": "Provide binding sites for proteins that regulate gene expression"
+    }
+}
+
+_DNA_FACTS_JSON = orjson.dumps(DNA_FACTS)
+_MOLECULAR_COMPONENTS_JSON = orjson.dumps(MOLECULAR_COMPONENTS)
 
 # Educational endpoints
 @app.get("/api/education/dna-facts")
-async def get_dna_facts() -> List[Dict]:
+async def get_dna_facts() -> Response:
     """Get interesting facts about DNA"""
-    return [
-        {
-            "title": "DNA Structure",
-            "fact": "DNA has a double helix structure, like a twisted ladder, discovered by Watson, Crick, Franklin, and Wilkins.",
-            "category": "structure"
-        },
-        {
-            "title": "Base Pairing",
-            "fact": "Adenine always pairs with Thymine (2 H-bonds), and Guanine always pairs with Cytosine (3 H-bonds).",
-            "category": "bonding"
-        },
-        {
-            "title": "Human DNA",
-            "fact": "Human DNA contains about 3 billion base pairs and would stretch about 2 meters if unwound from a single cell.",
-            "category": "biology"
-        },
-        {
-            "title": "Genetic Code",
-            "fact": "The sequence of DNA bases determines the genetic instructions for all living organisms.",
-            "category": "genetics"
-        }
-    ]
+    return Response(content=_DNA_FACTS_JSON, media_type="application/json")
 
 @app.get("/api/education/molecular-components")
-async def get_molecular_components() -> Dict:
+async def get_molecular_components() -> Response:
     """Get information about DNA molecular components"""
-    return {
-        "sugar_phosphate_backbone": {
-            "description": "The structural framework of DNA, alternating sugar (deoxyribose) and phosphate groups",
-            "function": "Provides structural stability and protection for the bases"
-        },
-        "nitrogenous_bases": {
-            "description": "Four types of bases (A, T, G, C) that carry genetic information",
-            "function": "Store genetic information through their sequence"
-        },
-        "hydrogen_bonds": {
-            "description": "Weak bonds between complementary base pairs",
-            "function": "Hold the two DNA strands together while allowing separation during replication"
-        },
-        "major_minor_grooves": {
-            "description": "Spiral grooves in the DNA double helix",
-            "function": "Provide binding sites for proteins that regulate gene expression"
-        }
-    }
+    return Response(content=_MOLECULAR_COMPONENTS_JSON, media_type="application/json")
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     
     print("Starting DNA Explorer API Server...")
@@ -528,10 +644,18 @@ if __name__ == "__main__":
     print("• WebSocket: ws://localhost:8000/ws")
     print()
     
+    # Config, DNA data and WebSocket connections live in this process, so the
+    # server runs a single worker by default. WORKERS > 1 is opt-in: state is
+    # not shared between workers, so config/DNA reads and WebSocket updates only
+    # reflect changes handled by the same worker.
+    # "auto" picks uvloop and httptools (installed with uvicorn[standard]) and
+    # falls back to asyncio/h11 where they are unavailable, e.g. on Windows.
     uvicorn.run(
         "main:app", 
         host="0.0.0.0", 
         port=8000, 
-        reload=True,
-        log_level="info"
+        workers=int(os.getenv("WORKERS", 1)),
+        loop="auto",
+        http="auto",
+        log_level="warning"
     )
\ No newline at end of file
@@ -1,11 +1,11 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-import requests
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+import httpx
 import json
 
-app = Flask(__name__)
-CORS(app)
-
 # Perplexity API Configuration
 import os
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
@@ -14,15 +14,39 @@ PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
 # Use sonar-pro model
 MODEL = "sonar-pro"
 
+# Shared async HTTP client; HTTP/2 multiplexes concurrent requests over one connection
+client = httpx.AsyncClient(
+    timeout=30.0,
+    http2=True,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await client.aclose()
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+class ChatRequest(BaseModel):
+    message: str = ''
+    stream: bool = False
+
 
 print(f"🤖 Using model: {MODEL}")
 
-@app.route('/')
-def home():
-    return jsonify({"status": "Server is running", "message": "Use /chat endpoint for AI"})
+@app.get('/')
+async def home():
+    return {"status": "Server is running", "message": "Use /chat endpoint for AI"}
 
-@app.route('/test-api', methods=['GET'])
-def test_api():
+@app.get('/test-api')
+async def test_api():
     """Test the sonar-pro model"""
     try:
         headers = {
@@ -40,7 +64,7 @@ def test_api():
         }
         
         print(f"🧪 Testing model: {MODEL}")
-        response = requests.post(PERPLEXITY_API_URL, headers=headers, json=payload, timeout=30)
+        response = await client.post(PERPLEXITY_API_URL, headers=headers, json=payload)
         
         result = {
             "model": MODEL,
@@ -57,22 +81,48 @@ def test_api():
             result["error"] = response.text
             print(f"❌ API test failed: {response.status_code}")
             
-        return jsonify(result)
+        return result
         
     except Exception as e:
         print(f"💥 API test error: {e}")
-        return jsonify({"error": str(e)}), 500
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+async def stream_chat(response: httpx.Response):
+    """Forward a streamed Perplexity completion to the client as server-sent events"""
+    try:
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                chunk = json.loads(data)
+                delta = chunk.get('choices', [{}])[0].get('delta', {}).get('content')
+                if delta:
+                    yield f"data: {json.dumps({'response': delta})}\n\n"
+        except httpx.TimeoutException:
+            print("⏰ API stream timeout")
+            yield f"data: {json.dumps({'error': 'API request timeout - server took too long to respond'})}\n\n"
+        except httpx.HTTPError:
+            print("🌐 Network error while streaming")
+            yield f"data: {json.dumps({'error': 'Network connection failed - check your internet'})}\n\n"
+        except (ValueError, AttributeError, IndexError) as e:
+            print(f"💥 Unexpected stream format: {e}")
+            yield f"data: {json.dumps({'error': 'Unexpected response format from AI service'})}\n\n"
+        yield "data: [DONE]\n\n"
+    finally:
+        await response.aclose()
 
-@app.route('/chat', methods=['POST'])
-def chat():
+@app.post('/chat')
+async def chat(req: ChatRequest):
     try:
-        data = request.json
-        user_message = data.get('message', '')
+        user_message = req.message
         
         print(f"📨 Received: {user_message}")
         
         if not user_message:
-            return jsonify({'error': 'No message provided'}), 400
+            return JSONResponse({'error': 'No message provided'}, status_code=400)
         
         # Prepare API request with sonar-pro
         headers = {
@@ -102,9 +152,25 @@ def chat():
         
         print(f"🔄 Sending to Perplexity API with model: {MODEL}")
         
-        response = requests.post(PERPLEXITY_API_URL, headers=headers, json=payload, timeout=30)
-        
-        print(f"📡 Response Status: {response.status_code}")
+        if req.stream:
+            # Stream tokens back as they are generated instead of buffering the full answer
+            payload["stream"] = True
+            request = client.build_request("POST", PERPLEXITY_API_URL, headers=headers, json=payload)
+            response = await client.send(request, stream=True)
+            
+            print(f"📡 Response Status: {response.status_code}")
+            
+            if response.status_code == 200:
+                print("✅ Streaming API response")
+                return StreamingResponse(stream_chat(response), media_type="text/event-stream")
+            
+            # Read the error body so it can be reported like a buffered response
+            await response.aread()
+            await response.aclose()
+        else:
+            response = await client.post(PERPLEXITY_API_URL, headers=headers, json=payload)
+            
+            print(f"📡 Response Status: {response.status_code}")
         
         if response.status_code == 200:
             ai_response = response.json()
@@ -112,15 +178,15 @@ def chat():
             
             if 'choices' in ai_response and len(ai_response['choices']) > 0:
                 response_text = ai_response['choices'][0]['message']['content']
-                return jsonify({
+                return {
                     'response': response_text,
                     'source': 'perplexity_ai',
                     'model': MODEL
-                })
+                }
             else:
-                return jsonify({
+                return JSONResponse({
                     'error': 'Unexpected response format from AI service'
-                }), 500
+                }, status_code=500)
                 
         else:
             error_info = {
@@ -131,35 +197,35 @@ def chat():
             
             # Provide helpful error messages
             if response.status_code == 400:
-                return jsonify({
+                return JSONResponse({
                     'error': 'Bad request - invalid parameters',
                     'details': 'The request format might be incorrect'
-                }), 500
+                }, status_code=500)
             elif response.status_code == 401:
-                return jsonify({
+                return JSONResponse({
                     'error': 'Invalid API Key',
                     'details': 'Please check your Perplexity API key'
-                }), 500
+                }, status_code=500)
             elif response.status_code == 429:
-                return jsonify({
+                return JSONResponse({
                     'error': 'Rate Limit Exceeded',
                     'details': 'Too many requests. Please wait a moment.'
-                }), 500
+                }, status_code=500)
             else:
-                return jsonify({
+                return JSONResponse({
                     'error': f'API error {response.status_code}',
                     'details': response.text
-                }), 500
+                }, status_code=500)
     
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("⏰ API request timeout")
-        return jsonify({'error': 'API request timeout - server took too long to respond'}), 500
-    except requests.exceptions.ConnectionError:
+        return JSONResponse({'error': 'API request timeout - server took too long to respond'}, status_code=500)
+    except httpx.NetworkError:
         print("🌐 Network connection error")
-        return jsonify({'error': 'Network connection failed - check your internet'}), 500
+        return JSONResponse({'error': 'Network connection failed - check your internet'}, status_code=500)
     except Exception as e:
         print(f"💥 Unexpected error: {e}")
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
+        return JSONResponse({'error': f'Server error: {str(e)}'}, status_code=500)
 
 if __name__ == '__main__':
     print("🚀 Starting AI Server with sonar-pro...")
@@ -167,4 +233,5 @@ if __name__ == '__main__':
     print("🤖 Model: sonar-pro")
     print("🎯 Will answer ANY question with real AI")
     print("=" * 50)
-    app.run(debug=True, port=5001, host='0.0.0.0')
\ No newline at end of file
+    import uvicorn
+    uvicorn.run(app, host='0.0.0.0', port=5001)
\ No newline at end of file
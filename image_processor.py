@@ -1,4 +1,4 @@
-﻿from flask import Flask, request, jsonify
+﻿from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import cv2
 import numpy as np
@@ -7,21 +7,77 @@ from PIL import Image
 import io
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=['X-Image-Width', 'X-Image-Height'])
+
+# Larger images are downscaled before processing; points only sample every 10th pixel
+MAX_DEPTH_MAP_SIDE = 512
 
 def create_depth_map(image_array):
-    """Convert image to depth map for 3D effect"""
+    """Convert image to depth map for 3D effect
+
+    Images larger than MAX_DEPTH_MAP_SIDE are downscaled, so the result may be
+    smaller than the input.
+    """
+    # Downscale large images so the longest side is at most MAX_DEPTH_MAP_SIDE
+    height, width = image_array.shape[:2]
+    scale = MAX_DEPTH_MAP_SIDE / max(height, width)
+    if scale < 1:
+        height, width = max(1, round(height * scale)), max(1, round(width * scale))
+        image_array = cv2.resize(image_array, (width, height), interpolation=cv2.INTER_AREA)
+    
     # Convert to grayscale
     gray = cv2.cvtColor(image_array, cv2.COLOR_RGB2GRAY)
     
     # Apply edge detection for depth
     edges = cv2.Canny(gray, 100, 200)
+    if not edges.any():
+        return edges
     
-    # Create depth map (edges = high depth, smooth areas = low depth)
-    depth = cv2.GaussianBlur(edges, (5, 5), 0)
-    depth = cv2.normalize(depth, None, 0, 255, cv2.NORM_MINMAX)
+    # Create depth map from the distance to the nearest edge
+    # (edges = high depth, falling off smoothly with distance)
+    distance = cv2.distanceTransform(255 - edges, cv2.DIST_L2, 3)
+    depth = cv2.normalize(distance, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+    
+    return 255 - depth
+
+def load_image_array():
+    """Read the uploaded image from the request as a numpy array, or None if missing
+
+    Accepts either JSON with a base64 data URL under 'image' or the raw image
+    bytes as the request body.
+    """
+    if request.is_json:
+        image_data = request.json.get('image')
+        if not image_data:
+            return None
+        image_bytes = base64.b64decode(image_data.split(',')[1])
+    else:
+        image_bytes = request.get_data()
+        if not image_bytes:
+            return None
+    
+    image = Image.open(io.BytesIO(image_bytes))
+    return np.array(image)
+
+def sample_points(depth_map, image_size):
+    """Sample up to 1000 (x, y, z) points from the depth map as an (N, 3) array
+
+    x and y are in the pixel coordinates of the original (height, width) image_size,
+    which differs from the depth map size when the image was downscaled.
+    """
+    height, width = depth_map.shape
+    scale_x = image_size[1] / width
+    scale_y = image_size[0] / height
     
-    return depth
+    # Sample points for 3D mesh (every 10th pixel for performance),
+    # limited to the first 1000 before building any Python objects
+    ys, xs = np.mgrid[0:height:10, 0:width:10]
+    depth_values = depth_map[::10, ::10].ravel()[:1000] / 255.0
+    return np.stack([
+        (xs.ravel()[:1000] - width/2) * scale_x,
+        (height/2 - ys.ravel()[:1000]) * scale_y,
+        depth_values * 50  # Scale depth
+    ], axis=1)
 
 @app.route('/')
 def home():
@@ -32,17 +88,11 @@ def convert_to_3d():
     """Convert uploaded image to 3D data"""
     try:
         # Get image data from request
-        data = request.json
-        image_data = data.get('image')
+        image_array = load_image_array()
         
-        if not image_data:
+        if image_array is None:
             return jsonify({'success': False, 'error': 'No image provided'}), 400
         
-        # Decode base64 image
-        image_bytes = base64.b64decode(image_data.split(',')[1])
-        image = Image.open(io.BytesIO(image_bytes))
-        image_array = np.array(image)
-        
         # Create depth map
         depth_map = create_depth_map(image_array)
         
@@ -51,23 +101,13 @@ def convert_to_3d():
         depth_base64 = base64.b64encode(buffer).decode('utf-8')
         
         # Prepare 3D points
-        height, width = depth_map.shape
-        points = []
-        
-        # Sample points for 3D mesh (every 10th pixel for performance)
-        for y in range(0, height, 10):
-            for x in range(0, width, 10):
-                depth_value = depth_map[y, x] / 255.0
-                points.append({
-                    'x': x - width/2,
-                    'y': height/2 - y,
-                    'z': depth_value * 50  # Scale depth
-                })
+        height, width = image_array.shape[:2]
+        points = [{'x': x, 'y': y, 'z': z} for x, y, z in sample_points(depth_map, (height, width)).tolist()]
         
         return jsonify({
             'success': True,
             'depth_map': f'data:image/png;base64,{depth_base64}',
-            'points': points[:1000],  # Limit points for performance
+            'points': points,
             'original_size': {'width': width, 'height': height}
         })
         
@@ -77,6 +117,50 @@ def convert_to_3d():
             'error': str(e)
         }), 500
 
+@app.route('/api/convert-to-3d/depth', methods=['POST'])
+def convert_to_3d_depth():
+    """Return the depth map of the uploaded image as raw PNG bytes"""
+    try:
+        image_array = load_image_array()
+        
+        if image_array is None:
+            return jsonify({'success': False, 'error': 'No image provided'}), 400
+        
+        depth_map = create_depth_map(image_array)
+        _, buffer = cv2.imencode('.png', depth_map)
+        
+        return Response(buffer.tobytes(), mimetype='image/png')
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/convert-to-3d/points', methods=['POST'])
+def convert_to_3d_points():
+    """Return 3D points of the uploaded image as a packed float32 [x, y, z, ...] buffer"""
+    try:
+        image_array = load_image_array()
+        
+        if image_array is None:
+            return jsonify({'success': False, 'error': 'No image provided'}), 400
+        
+        depth_map = create_depth_map(image_array)
+        height, width = image_array.shape[:2]
+        points = sample_points(depth_map, (height, width)).astype(np.float32)
+        
+        response = Response(points.tobytes(), mimetype='application/octet-stream')
+        response.headers['X-Image-Width'] = str(width)
+        response.headers['X-Image-Height'] = str(height)
+        return response
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 if __name__ == '__main__':
     print("🚀 Starting Image Processor Server...")
     print("📡 http://localhost:5002")